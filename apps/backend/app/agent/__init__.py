@@ -4,6 +4,7 @@
 # * Else we fallback to a local Ollama model.
 # * If neither is available, we raise -> ProviderError.
 
+from .embedding import Embedding, cosine
 from .manager import AgentManager, EmbeddingManager
 
-__all__ = ["AgentManager", "EmbeddingManager"]
+__all__ = ["AgentManager", "Embedding", "EmbeddingManager", "cosine"]
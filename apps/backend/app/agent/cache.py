@@ -0,0 +1,65 @@
+import asyncio
+
+from hashlib import blake2b
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+CacheKey = Tuple[str, str]
+
+
+class EmbeddingCache:
+    """
+    Bounded LRU of embeddings keyed by (model, content hash). Concurrent misses
+    for the same key share one provider call (single-flight).
+    """
+
+    def __init__(self, maxsize: int = 4096) -> None:
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[CacheKey, np.ndarray]" = OrderedDict()
+        self._inflight: Dict[CacheKey, asyncio.Task] = {}
+
+    @staticmethod
+    def key(model: str, text: str) -> CacheKey:
+        return model, blake2b(text.encode(), digest_size=16).hexdigest()
+
+    def get(self, key: CacheKey) -> Optional[np.ndarray]:
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: CacheKey, value: np.ndarray) -> None:
+        # the same array is handed to every caller, so nobody may modify it
+        value.setflags(write=False)
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    async def get_or_compute(
+        self, key: CacheKey, compute: Callable[[], Awaitable[np.ndarray]]
+    ) -> np.ndarray:
+        """
+        Returns the cached value, or waits for the shared computation of the
+        key, starting it if none is in flight. The computation runs in its own
+        task, so cancelling one caller never cancels it for the others.
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(compute())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+        return await asyncio.shield(task)
+
+    def _finish(self, key: CacheKey, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # exception() also marks a failure as retrieved when nobody is waiting
+        if not task.cancelled() and task.exception() is None:
+            self.put(key, task.result())
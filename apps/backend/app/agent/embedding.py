@@ -0,0 +1,31 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass(frozen=True, slots=True)
+class Embedding:
+    """
+    An embedding vector together with its L2-normalized form, computed once
+    so repeated similarity checks reduce to a dot product.
+    """
+
+    vec: np.ndarray
+    unit: np.ndarray
+
+    @classmethod
+    def from_vector(cls, vec: np.ndarray) -> "Embedding":
+        """
+        Wraps a 1-D contiguous float32 vector, as returned by EmbeddingManager,
+        without copying or reshaping it.
+        """
+        norm = np.linalg.norm(vec)
+        unit = vec / norm if norm else np.zeros_like(vec)
+        return cls(vec=vec, unit=unit)
+
+
+def cosine(u: Embedding, v: Embedding) -> float:
+    """
+    Cosine similarity of two embeddings; 0.0 if either vector is all zeros.
+    """
+    return float(u.unit @ v.unit)
@@ -1,7 +1,10 @@
 import os
+import numpy as np
+
 from typing import Dict, Any
 
-from .exceptions import ProviderError
+from .cache import EmbeddingCache
+from .exceptions import ProviderError, StrategyError
 from .strategies.wrapper import JSONWrapper, MDWrapper
 from .providers.ollama import OllamaProvider, OllamaEmbeddingProvider
 from .providers.openai import OpenAIProvider, OpenAIEmbeddingProvider
@@ -17,19 +20,37 @@ class AgentManager:
             case _:
                 self.strategy = JSONWrapper()
         self.model = model
+        # providers (and their HTTP clients) are reused across runs
+        self._providers: Dict[str, OllamaProvider | OpenAIProvider] = {}
 
     async def _get_provider(self, **kwargs: Any) -> OllamaProvider | OpenAIProvider:
         api_key = kwargs.get("openai_api_key", os.getenv("OPENAI_API_KEY"))
         if api_key:
-            return OpenAIProvider(api_key=api_key)
+            cache_key = f"openai:{api_key}"
+            if cache_key not in self._providers:
+                self._providers[cache_key] = OpenAIProvider(api_key=api_key)
+            return self._providers[cache_key]
 
         model = kwargs.get("model", self.model)
+        cache_key = f"ollama:{model}"
+        if cache_key in self._providers:
+            return self._providers[cache_key]
         installed_ollama_models = await OllamaProvider.get_installed_models()
         if model not in installed_ollama_models:
             raise ProviderError(
                 f"Ollama Model '{model}' is not found. Run `ollama pull {model} or pick from any available models {installed_ollama_models}"
             )
-        return OllamaProvider(model_name=model)
+        self._providers[cache_key] = OllamaProvider(model_name=model)
+        return self._providers[cache_key]
+
+    def model_id(self, **kwargs: Any) -> str:
+        """
+        Identifies the provider and model that run() would use with the same
+        kwargs, without creating the provider.
+        """
+        if kwargs.get("openai_api_key", os.getenv("OPENAI_API_KEY")):
+            return f"openai:{OpenAIProvider.DEFAULT_MODEL}"
+        return f"ollama:{kwargs.get('model', self.model)}"
 
     async def run(self, prompt: str, **kwargs: Any) -> Dict[str, Any]:
         """
@@ -38,28 +59,95 @@ class AgentManager:
         provider = await self._get_provider(**kwargs)
         return await self.strategy(prompt, provider, **kwargs)
 
+    async def run_raw(self, prompt: str, **kwargs: Any) -> str:
+        """
+        Run the agent and return the unparsed JSON text from the JSON strategy.
+        """
+        if not isinstance(self.strategy, JSONWrapper):
+            raise StrategyError("run_raw is only supported by the JSON strategy")
+        provider = await self._get_provider(**kwargs)
+        return await self.strategy.raw(prompt, provider, **kwargs)
+
+
+# shared by every EmbeddingManager, so identical content is embedded once per process
+_embedding_cache = EmbeddingCache()
+
 
 class EmbeddingManager:
     def __init__(self, model: str = "nomic-embed-text:latest") -> None:
         self._model = model
+        # providers (and their HTTP clients) are reused across calls
+        self._providers: Dict[
+            str, OllamaEmbeddingProvider | OpenAIEmbeddingProvider
+        ] = {}
 
     async def _get_embedding_provider(
         self, **kwargs: Any
     ) -> OllamaEmbeddingProvider | OpenAIEmbeddingProvider:
         api_key = kwargs.get("openai_api_key", os.getenv("OPENAI_API_KEY"))
         if api_key:
-            return OpenAIEmbeddingProvider(api_key=api_key)
+            cache_key = f"openai:{api_key}"
+            if cache_key not in self._providers:
+                self._providers[cache_key] = OpenAIEmbeddingProvider(api_key=api_key)
+            return self._providers[cache_key]
         model = kwargs.get("embedding_model", self._model)
+        cache_key = f"ollama:{model}"
+        if cache_key in self._providers:
+            return self._providers[cache_key]
         installed_ollama_models = await OllamaProvider.get_installed_models()
         if model not in installed_ollama_models:
             raise ProviderError(
                 f"Ollama Model '{model}' is not found. Run `ollama pull {model} or pick from any available models {installed_ollama_models}"
             )
-        return OllamaEmbeddingProvider(embedding_model=model)
+        self._providers[cache_key] = OllamaEmbeddingProvider(embedding_model=model)
+        return self._providers[cache_key]
 
-    async def embed(self, text: str, **kwargs: Any) -> list[float]:
+    async def embed(self, text: str, **kwargs: Any) -> np.ndarray:
         """
-        Get the embedding for the given text.
+        Get the embedding for the given text as a 1-D contiguous float32 array
+        (callers rely on this and do not re-convert it), served from the
+        embedding cache when the same content was embedded before with the
+        same model.
         """
         provider = await self._get_embedding_provider(**kwargs)
-        return await provider.embed(text)
+        key = _embedding_cache.key(self._cache_model(provider), text)
+
+        async def _compute() -> np.ndarray:
+            return np.asarray(await provider.embed(text), dtype=np.float32).reshape(-1)
+
+        return await _embedding_cache.get_or_compute(key, _compute)
+
+    async def embed_many(self, texts: list[str], **kwargs: Any) -> np.ndarray:
+        """
+        Get the embeddings for several texts as a (len(texts), dim) float32
+        matrix.
+        Only texts missing from the embedding cache are sent to the provider,
+        in a single call.
+        """
+        if not texts:
+            return np.empty((0, 0), dtype=np.float32)
+        provider = await self._get_embedding_provider(**kwargs)
+        model = self._cache_model(provider)
+        keys = [_embedding_cache.key(model, text) for text in texts]
+
+        vectors: Dict[Any, np.ndarray] = {}
+        misses: Dict[Any, str] = {}
+        for key, text in zip(keys, texts):
+            cached = _embedding_cache.get(key)
+            if cached is None:
+                misses.setdefault(key, text)
+            else:
+                vectors[key] = cached
+        if misses:
+            embedded = await provider.embed_many(list(misses.values()))
+            for key, vector in zip(misses, embedded):
+                vectors[key] = np.asarray(vector, dtype=np.float32).reshape(-1)
+                _embedding_cache.put(key, vectors[key])
+
+        return np.stack([vectors[key] for key in keys])
+
+    @staticmethod
+    def _cache_model(
+        provider: OllamaEmbeddingProvider | OpenAIEmbeddingProvider,
+    ) -> str:
+        return f"{type(provider).__name__}:{provider._model}"
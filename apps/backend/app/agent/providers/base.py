@@ -18,3 +18,6 @@ class EmbeddingProvider(ABC):
 
     @abstractmethod
     async def embed(self, text: str) -> list[float]: ...
+
+    @abstractmethod
+    async def embed_many(self, texts: list[str]) -> list[list[float]]: ...
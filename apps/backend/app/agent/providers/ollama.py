@@ -75,3 +75,18 @@ class OllamaEmbeddingProvider(EmbeddingProvider):
         except Exception as e:
             logger.error(f"ollama embedding error: {e}")
             raise ProviderError(f"Ollama - Error generating embedding: {e}")
+
+    async def embed_many(self, texts: List[str]) -> List[List[float]]:
+        """
+        Generate embeddings for several texts in a single request.
+        """
+        try:
+            response = await run_in_threadpool(
+                self._client.embed,
+                input=texts,
+                model=self._model,
+            )
+            return response.embeddings
+        except Exception as e:
+            logger.error(f"ollama embedding error: {e}")
+            raise ProviderError(f"Ollama - Error generating embeddings: {e}")
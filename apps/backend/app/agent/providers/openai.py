@@ -12,7 +12,9 @@ logger = logging.getLogger(__name__)
 
 
 class OpenAIProvider(Provider):
-    def __init__(self, api_key: str | None = None, model: str = "gpt-4o"):
+    DEFAULT_MODEL = "gpt-4o"
+
+    def __init__(self, api_key: str | None = None, model: str = DEFAULT_MODEL):
         api_key = api_key or os.getenv("OPENAI_API_KEY")
         if not api_key:
             raise ProviderError("OpenAI API key is missing")
@@ -62,3 +64,12 @@ class OpenAIEmbeddingProvider(EmbeddingProvider):
             return response["data"][0]["embedding"]
         except Exception as e:
             raise ProviderError(f"OpenAI - error generating embedding: {e}") from e
+
+    async def embed_many(self, texts: list[str]) -> list[list[float]]:
+        try:
+            response = await run_in_threadpool(
+                self._client.embeddings.create, input=texts, model=self._model
+            )
+            return [item.embedding for item in response.data]
+        except Exception as e:
+            raise ProviderError(f"OpenAI - error generating embeddings: {e}") from e
@@ -17,9 +17,7 @@ class JSONWrapper(Strategy):
         """
         Wrapper strategy to format the prompt as JSON with the help of LLM.
         """
-        response = await provider(prompt, **generation_args)
-        response = response.replace("```", "").replace("json", "").strip()
-        logger.info(f"provider response: {response}")
+        response = await self.raw(prompt, provider, **generation_args)
         try:
             return json.loads(response)
         except json.JSONDecodeError as e:
@@ -28,6 +26,18 @@ class JSONWrapper(Strategy):
             )
             raise StrategyError(f"JSON parsing error: {e}") from e
 
+    async def raw(
+        self, prompt: str, provider: Provider, **generation_args: Any
+    ) -> str:
+        """
+        Same as calling the wrapper, but returns the cleaned JSON text without
+        parsing it, so callers can validate it directly from JSON.
+        """
+        response = await provider(prompt, **generation_args)
+        response = response.replace("```", "").replace("json", "").strip()
+        logger.debug("provider response: %s", response)
+        return response
+
 
 class MDWrapper(Strategy):
     async def __call__(
@@ -36,9 +46,9 @@ class MDWrapper(Strategy):
         """
         Wrapper strategy to format the prompt as Markdown with the help of LLM.
         """
-        logger.info(f"prompt given to provider: \n{prompt}")
+        logger.debug("prompt given to provider: \n%s", prompt)
         response = await provider(prompt, **generation_args)
-        logger.info(f"provider response: {response}")
+        logger.debug("provider response: %s", response)
         try:
             response = (
                 "```md\n" + response + "```" if "```md" not in response else response
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import orjson
+
 from functools import lru_cache
-from typing import AsyncGenerator, Generator, Optional
+from typing import Any, AsyncGenerator, Generator, Optional
 
 from sqlalchemy import event, create_engine
 from sqlalchemy.engine import Engine
@@ -51,6 +53,11 @@ def _configure_sqlite(engine: Engine) -> None:
         cursor.close()
 
 
+def _json_serializer(obj: Any) -> str:
+    """orjson-backed encoder for JSON/JSONB columns (returns text, not bytes)."""
+    return orjson.dumps(obj).decode()
+
+
 @lru_cache(maxsize=1)
 def _make_sync_engine() -> Engine:
     """Create (or return) the global synchronous Engine."""
@@ -59,6 +66,8 @@ def _make_sync_engine() -> Engine:
         echo=settings.DB_ECHO,
         pool_pre_ping=True,
         connect_args=settings.DB_CONNECT_ARGS,
+        json_serializer=_json_serializer,
+        json_deserializer=orjson.loads,
         future=True,
     )
     _configure_sqlite(engine)
@@ -73,6 +82,8 @@ def _make_async_engine() -> AsyncEngine:
         echo=settings.DB_ECHO,
         pool_pre_ping=True,
         connect_args=settings.DB_CONNECT_ARGS,
+        json_serializer=_json_serializer,
+        json_deserializer=orjson.loads,
         future=True,
     )
     _configure_sqlite(engine.sync_engine)
@@ -0,0 +1,16 @@
+from sqlalchemy import Column, String, Text, DateTime, text
+
+from .base import Base
+
+
+class ExtractionCache(Base):
+    __tablename__ = "extraction_cache"
+
+    content_hash = Column(String, primary_key=True, index=True)
+    payload = Column(Text, nullable=False)
+    created_at = Column(
+        DateTime(timezone=True),
+        server_default=text("CURRENT_TIMESTAMP"),
+        nullable=False,
+        index=True,
+    )
@@ -1,10 +1,17 @@
+import orjson
+
+from typing import Any
 from sqlalchemy.types import JSON
 from sqlalchemy.orm import relationship
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy import Column, String, Text, Integer, ForeignKey, DateTime, text
 
 from .base import Base
 from .association import job_resume_association
 
+# Binary JSONB on PostgreSQL, plain JSON (TEXT) on SQLite and others
+JSONVariant = JSON().with_variant(JSONB(), "postgresql")
+
 
 class ProcessedJob(Base):
     __tablename__ = "processed_jobs"
@@ -16,16 +23,16 @@ class ProcessedJob(Base):
         index=True,
     )
     job_title = Column(String, nullable=False)
-    company_profile = Column(Text, nullable=True)
-    location = Column(String, nullable=True)
+    company_profile = Column(JSONVariant, nullable=True)
+    location = Column(JSONVariant, nullable=True)
     date_posted = Column(String, nullable=True)
     employment_type = Column(String, nullable=True)
     job_summary = Column(Text, nullable=False)
-    key_responsibilities = Column(JSON, nullable=True)
-    qualifications = Column(JSON, nullable=True)
-    compensation_and_benfits = Column(JSON, nullable=True)
-    application_info = Column(JSON, nullable=True)
-    extracted_keywords = Column(JSON, nullable=True)
+    key_responsibilities = Column(JSONVariant, nullable=True)
+    qualifications = Column(JSONVariant, nullable=True)
+    compensation_and_benfits = Column(JSONVariant, nullable=True)
+    application_info = Column(JSONVariant, nullable=True)
+    extracted_keywords = Column(JSONVariant, nullable=True)
     processed_at = Column(
         DateTime(timezone=True),
         server_default=text("CURRENT_TIMESTAMP"),
@@ -38,6 +45,23 @@ class ProcessedJob(Base):
     # owner = relationship("User", back_populates="processed_jobs")
     raw_job = relationship("Job", back_populates="raw_job_association")
 
+    def structured_field(self, name: str) -> Any:
+        """
+        Returns a structured JSON column. Rows written before the columns held
+        native JSON store a json.dumps() string instead, and wrap list fields
+        as {name: [...]}; those are decoded and unwrapped here so readers see
+        the same shape for old and new rows.
+        """
+        value = getattr(self, name)
+        if isinstance(value, str):
+            try:
+                value = orjson.loads(value)
+            except orjson.JSONDecodeError:
+                return value
+            if isinstance(value, dict) and value.keys() == {name}:
+                value = value[name]
+        return value
+
     # many-to-many relationship in job and resume
     processed_resumes = relationship(
         "ProcessedResume",
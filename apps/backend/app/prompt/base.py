@@ -1,6 +1,7 @@
 import pkgutil
 import importlib
-from typing import Dict
+from string import Formatter
+from typing import Any, Dict, List, Optional, Tuple
 
 from app.prompt import __path__ as prompt_pkg_path
 
@@ -8,6 +9,10 @@ from app.prompt import __path__ as prompt_pkg_path
 class PromptFactory:
     def __init__(self) -> None:
         self._prompts: Dict[str, str] = {}
+        self._prompt_parts: Dict[str, Tuple[str, str]] = {}
+        self._compiled: Dict[
+            str, Tuple[Tuple[str, ...], Tuple[Tuple[int | str, str], ...]]
+        ] = {}
         self._discover()
 
     def _discover(self) -> None:
@@ -18,6 +23,46 @@ class PromptFactory:
             module = importlib.import_module(f"app.prompt.{module_name}")
             if hasattr(module, "PROMPT"):
                 self._prompts[module_name] = getattr(module, "PROMPT")
+                compiled = self._compile(getattr(module, "PROMPT"))
+                if compiled:
+                    self._compiled[module_name] = compiled
+            if hasattr(module, "PROMPT_PREFIX") and hasattr(module, "PROMPT_SUFFIX"):
+                self._prompt_parts[module_name] = (
+                    getattr(module, "PROMPT_PREFIX"),
+                    getattr(module, "PROMPT_SUFFIX"),
+                )
+
+    @staticmethod
+    def _compile(
+        template: str,
+    ) -> Optional[Tuple[Tuple[str, ...], Tuple[Tuple[int | str, str], ...]]]:
+        """
+        Pre-splits a template made of positional ("{0}") or named ("{name}")
+        fields, optionally with a format spec ("{score:.4f}"), into its literal
+        chunks and (field, spec) pairs, with "{{"/"}}" unescaped.
+        Returns None for templates using auto-numbering, conversions,
+        attribute/index lookups or nested specs.
+        """
+        literals: List[str] = []
+        fields: List[Tuple[int | str, str]] = []
+        pending = ""
+        for literal, field, spec, conversion in Formatter().parse(template):
+            pending += literal
+            if field is None:
+                continue
+            if conversion or "{" in spec:
+                return None
+            if field.isdigit():
+                key: int | str = int(field)
+            elif field.isidentifier():
+                key = field
+            else:
+                return None
+            literals.append(pending)
+            fields.append((key, spec))
+            pending = ""
+        literals.append(pending)
+        return tuple(literals), tuple(fields)
 
     def list_prompts(self) -> Dict[str, str]:
         return self._prompts
@@ -29,3 +74,33 @@ class PromptFactory:
             raise KeyError(
                 f"Prompt '{name}' not found. Available prompts: {list(self._prompts.keys())}"
             )
+
+    def get_parts(self, name: str) -> Tuple[str, str]:
+        """
+        Returns the static (prefix, suffix) pair of a prompt that wraps a single
+        variable input, for prompts that are split for prefix caching.
+        """
+        try:
+            return self._prompt_parts[name]
+        except KeyError:
+            raise KeyError(
+                f"Prompt parts '{name}' not found. Available prompt parts: {list(self._prompt_parts.keys())}"
+            )
+
+    def build(self, name: str, *args: Any, **kwargs: Any) -> str:
+        """
+        Fills a prompt by joining its pre-split chunks with the args, equivalent
+        to get(name).format(*args, **kwargs) without re-parsing the template.
+        """
+        try:
+            literals, fields = self._compiled[name]
+        except KeyError:
+            raise KeyError(
+                f"Compiled prompt '{name}' not found. Available compiled prompts: {list(self._compiled.keys())}"
+            )
+        parts = [literals[0]]
+        for (field, spec), literal in zip(fields, literals[1:]):
+            value = args[field] if isinstance(field, int) else kwargs[field]
+            parts.append(format(value, spec))
+            parts.append(literal)
+        return "".join(parts)
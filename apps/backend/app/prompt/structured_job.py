@@ -1,4 +1,12 @@
-PROMPT = """
+import json
+
+from app.schemas.json.structured_job import SCHEMA
+
+# Everything that does not depend on the job posting lives in PROMPT_PREFIX so
+# the bytes sent ahead of the posting are identical on every call, which lets
+# providers with automatic prompt caching reuse the prefill for that prefix.
+PROMPT_PREFIX = (
+    """
 You are a JSON-extraction engine specialized in parsing job postings. Your task is to convert the raw job posting text into a valid JSON object that matches the exact schema below.
 
 CRITICAL REQUIREMENTS:
@@ -12,47 +20,50 @@ CRITICAL REQUIREMENTS:
 
 JSON Schema:
 ```json
-{0}
+"""
+    + json.dumps(SCHEMA, indent=2)
+    + """
 ```
 
 Example Output Format:
 ```json
-{{
+{
   "jobTitle": "Software Engineer",
-  "companyProfile": {{
+  "companyProfile": {
     "companyName": "TechCorp Inc",
     "industry": "Technology",
     "website": "https://techcorp.com",
     "description": "Leading technology company"
-  }},
-  "location": {{
+  },
+  "location": {
     "city": "San Francisco",
     "state": "CA", 
     "country": "USA",
     "remoteStatus": "Hybrid"
-  }},
+  },
   "datePosted": "2024-01-15",
   "employmentType": "Full-time",
   "jobSummary": "We are seeking a talented software engineer...",
   "keyResponsibilities": ["Develop software applications", "Code reviews"],
-  "qualifications": {{
+  "qualifications": {
     "required": ["Bachelor's degree", "3+ years experience"],
     "preferred": ["Master's degree", "Python experience"]
-  }},
-  "compensationAndBenefits": {{
+  },
+  "compensationAndBenefits": {
     "salaryRange": "$80,000 - $120,000",
     "benefits": ["Health insurance", "401k"]
-  }},
-  "applicationInfo": {{
+  },
+  "applicationInfo": {
     "howToApply": "Apply online",
     "applyLink": "https://techcorp.com/careers/123",
     "contactEmail": "jobs@techcorp.com"
-  }},
+  },
   "extractedKeywords": ["software", "engineering", "python", "javascript"]
-}}
+}
 ```
 
 Job Posting Text:
-{1}
+"""
+)
 
-Generate the JSON output now (JSON only, no other text):"""
+PROMPT_SUFFIX = "\n\nGenerate the JSON output now (JSON only, no other text):"
@@ -1,10 +1,39 @@
 import enum
-from typing import Optional, List, Union
-from pydantic import BaseModel, Field, field_validator, model_validator
+from types import MappingProxyType
+from typing import Annotated, Optional, List, Union
+from pydantic import (
+    AfterValidator,
+    BaseModel,
+    ConfigDict,
+    Field,
+    field_validator,
+    model_validator,
+)
 from datetime import datetime
 
 
-class EmploymentTypeEnum(str, enum.Enum):
+class _CaseInsensitiveEnum(str, enum.Enum):
+    """Base for str enums resolved through a lookup built once per class."""
+
+    @classmethod
+    def _missing_(cls, value: object):
+        """Handles case-insensitive lookup."""
+        if isinstance(value, str):
+            return cls._MAP.get(value.strip().lower(), cls.NOT_SPECIFIED)
+        return cls.NOT_SPECIFIED
+
+
+def _bind_lookup(enum_cls: type[_CaseInsensitiveEnum], synonyms: dict) -> None:
+    """
+    Freezes the lowercased member values plus synonyms into enum_cls._MAP so
+    that resolving any unknown value is a single dict probe.
+    """
+    enum_cls._MAP = MappingProxyType(
+        {**{member.value.lower(): member for member in enum_cls}, **synonyms}
+    )
+
+
+class EmploymentTypeEnum(_CaseInsensitiveEnum):
     """Case-insensitive Enum for employment types."""
 
     FULL_TIME = "Full-time"
@@ -14,46 +43,27 @@ class EmploymentTypeEnum(str, enum.Enum):
     TEMPORARY = "Temporary"
     NOT_SPECIFIED = "Not Specified"
 
-    @classmethod
-    def _missing_(cls, value: object):
-        """Handles case-insensitive lookup."""
-        if isinstance(value, str):
-            value_lower = value.lower().strip()
-            # Create a comprehensive mapping
-            mapping = {
-                'full-time': cls.FULL_TIME,
-                'fulltime': cls.FULL_TIME,
-                'full time': cls.FULL_TIME,
-                'permanent': cls.FULL_TIME,
-                'part-time': cls.PART_TIME,
-                'parttime': cls.PART_TIME,
-                'part time': cls.PART_TIME,
-                'contract': cls.CONTRACT,
-                'contractor': cls.CONTRACT,
-                'freelance': cls.CONTRACT,
-                'internship': cls.INTERNSHIP,
-                'intern': cls.INTERNSHIP,
-                'temporary': cls.TEMPORARY,
-                'temp': cls.TEMPORARY,
-                'not specified': cls.NOT_SPECIFIED,
-                'unspecified': cls.NOT_SPECIFIED,
-                'unknown': cls.NOT_SPECIFIED,
-                '': cls.NOT_SPECIFIED,
-            }
-            
-            if value_lower in mapping:
-                return mapping[value_lower]
-            
-            # Try exact match with enum values
-            for member in cls:
-                if member.value.lower() == value_lower:
-                    return member
-                    
-        # Default fallback
-        return cls.NOT_SPECIFIED
-
 
-class RemoteStatusEnum(str, enum.Enum):
+_bind_lookup(
+    EmploymentTypeEnum,
+    {
+        "fulltime": EmploymentTypeEnum.FULL_TIME,
+        "full time": EmploymentTypeEnum.FULL_TIME,
+        "permanent": EmploymentTypeEnum.FULL_TIME,
+        "parttime": EmploymentTypeEnum.PART_TIME,
+        "part time": EmploymentTypeEnum.PART_TIME,
+        "contractor": EmploymentTypeEnum.CONTRACT,
+        "freelance": EmploymentTypeEnum.CONTRACT,
+        "intern": EmploymentTypeEnum.INTERNSHIP,
+        "temp": EmploymentTypeEnum.TEMPORARY,
+        "unspecified": EmploymentTypeEnum.NOT_SPECIFIED,
+        "unknown": EmploymentTypeEnum.NOT_SPECIFIED,
+        "": EmploymentTypeEnum.NOT_SPECIFIED,
+    },
+)
+
+
+class RemoteStatusEnum(_CaseInsensitiveEnum):
     """Case-insensitive Enum for remote work status."""
 
     FULLY_REMOTE = "Fully Remote"
@@ -63,48 +73,49 @@ class RemoteStatusEnum(str, enum.Enum):
     NOT_SPECIFIED = "Not Specified"
     MULTIPLE_LOCATIONS = "Multiple Locations"
 
-    @classmethod
-    def _missing_(cls, value: object):
-        """Handles case-insensitive lookup."""
-        if isinstance(value, str):
-            value_lower = value.lower().strip()
-            # Create a comprehensive mapping
-            mapping = {
-                'fully remote': cls.FULLY_REMOTE,
-                'full remote': cls.FULLY_REMOTE,
-                'completely remote': cls.FULLY_REMOTE,
-                '100% remote': cls.FULLY_REMOTE,
-                'remote': cls.REMOTE,
-                'work from home': cls.REMOTE,
-                'wfh': cls.REMOTE,
-                'hybrid': cls.HYBRID,
-                'mixed': cls.HYBRID,
-                'on-site': cls.ON_SITE,
-                'onsite': cls.ON_SITE,
-                'on site': cls.ON_SITE,
-                'office': cls.ON_SITE,
-                'in-person': cls.ON_SITE,
-                'not specified': cls.NOT_SPECIFIED,
-                'unspecified': cls.NOT_SPECIFIED,
-                'unknown': cls.NOT_SPECIFIED,
-                '': cls.NOT_SPECIFIED,
-                'multiple locations': cls.MULTIPLE_LOCATIONS,
-                'various locations': cls.MULTIPLE_LOCATIONS,
-            }
-            
-            if value_lower in mapping:
-                return mapping[value_lower]
-            
-            # Try exact match with enum values  
-            for member in cls:
-                if member.value.lower() == value_lower:
-                    return member
-                    
-        # Default fallback
-        return cls.NOT_SPECIFIED
+
+_bind_lookup(
+    RemoteStatusEnum,
+    {
+        "full remote": RemoteStatusEnum.FULLY_REMOTE,
+        "completely remote": RemoteStatusEnum.FULLY_REMOTE,
+        "100% remote": RemoteStatusEnum.FULLY_REMOTE,
+        "work from home": RemoteStatusEnum.REMOTE,
+        "wfh": RemoteStatusEnum.REMOTE,
+        "mixed": RemoteStatusEnum.HYBRID,
+        "onsite": RemoteStatusEnum.ON_SITE,
+        "on site": RemoteStatusEnum.ON_SITE,
+        "office": RemoteStatusEnum.ON_SITE,
+        "in-person": RemoteStatusEnum.ON_SITE,
+        "unspecified": RemoteStatusEnum.NOT_SPECIFIED,
+        "unknown": RemoteStatusEnum.NOT_SPECIFIED,
+        "": RemoteStatusEnum.NOT_SPECIFIED,
+        "various locations": RemoteStatusEnum.MULTIPLE_LOCATIONS,
+    },
+)
+
+
+def _drop_empty(v: Optional[List[str]]) -> List[str]:
+    """Drops empty entries; items are already stripped by str_strip_whitespace."""
+    return list(filter(None, v or ()))
+
+
+# Shared by every string-list field, so one validator serves all of them
+_StrList = Annotated[List[str], AfterValidator(_drop_empty)]
+_OptionalStrList = Annotated[Optional[List[str]], AfterValidator(_drop_empty)]
+
+
+class _JobSchemaModel(BaseModel):
+    """Shared config: strings are stripped inside pydantic-core before validators run."""
+
+    model_config = ConfigDict(
+        validate_by_name=True,
+        str_strip_whitespace=True,
+        extra="ignore",  # Ignore extra fields instead of raising error
+    )
 
 
-class CompanyProfile(BaseModel):
+class CompanyProfile(_JobSchemaModel):
     company_name: str = Field(..., alias="companyName")
     industry: Optional[str] = Field(default=None)
     website: Optional[str] = Field(default=None)
@@ -113,12 +124,10 @@ class CompanyProfile(BaseModel):
     @field_validator('company_name')
     @classmethod
     def validate_company_name(cls, v):
-        if not v or not v.strip():
-            return "Unknown Company"
-        return v.strip()
+        return v or "Unknown Company"
 
 
-class Location(BaseModel):
+class Location(_JobSchemaModel):
     city: Optional[str] = Field(default=None)
     state: Optional[str] = Field(default=None)
     country: Optional[str] = Field(default=None)
@@ -127,49 +136,39 @@ class Location(BaseModel):
     @field_validator('city', 'state', 'country')
     @classmethod
     def validate_location_fields(cls, v):
-        if v and v.strip():
-            return v.strip()
-        return None
+        return v or None
 
+    @field_validator('remote_status', mode='before')
+    @classmethod
+    def validate_remote_status(cls, v):
+        # JSON-mode enum validation never reaches _missing_, so resolve here
+        return RemoteStatusEnum(v) if isinstance(v, str) else v
 
-class Qualifications(BaseModel):
-    required: List[str] = Field(default_factory=list)
-    preferred: Optional[List[str]] = Field(default_factory=list)
 
-    @field_validator('required', 'preferred')
-    @classmethod
-    def validate_qualifications(cls, v):
-        if not v:
-            return []
-        return [item.strip() for item in v if item and item.strip()]
+class Qualifications(_JobSchemaModel):
+    required: _StrList = Field(default_factory=list)
+    preferred: _OptionalStrList = Field(default_factory=list)
 
 
-class CompensationAndBenefits(BaseModel):
+class CompensationAndBenefits(_JobSchemaModel):
     salary_range: Optional[str] = Field(default=None, alias="salaryRange")
-    benefits: Optional[List[str]] = Field(default_factory=list)
-
-    @field_validator('benefits')
-    @classmethod
-    def validate_benefits(cls, v):
-        if not v:
-            return []
-        return [item.strip() for item in v if item and item.strip()]
+    benefits: _OptionalStrList = Field(default_factory=list)
 
 
-class ApplicationInfo(BaseModel):
+class ApplicationInfo(_JobSchemaModel):
     how_to_apply: Optional[str] = Field(default=None, alias="howToApply")
     apply_link: Optional[str] = Field(default=None, alias="applyLink")
     contact_email: Optional[str] = Field(default=None, alias="contactEmail")
 
 
-class StructuredJobModel(BaseModel):
+class StructuredJobModel(_JobSchemaModel):
     job_title: str = Field(..., alias="jobTitle")
     company_profile: CompanyProfile = Field(..., alias="companyProfile")
     location: Location = Field(default_factory=Location)
     date_posted: str = Field(default="", alias="datePosted")
     employment_type: EmploymentTypeEnum = Field(default=EmploymentTypeEnum.NOT_SPECIFIED, alias="employmentType")
     job_summary: str = Field(default="", alias="jobSummary")
-    key_responsibilities: List[str] = Field(default_factory=list, alias="keyResponsibilities")
+    key_responsibilities: _StrList = Field(default_factory=list, alias="keyResponsibilities")
     qualifications: Qualifications = Field(default_factory=Qualifications)
     compensation_and_benefits: Optional[CompensationAndBenefits] = Field(
         default_factory=CompensationAndBenefits, alias="compensationAndBenefits"
@@ -177,30 +176,20 @@ class StructuredJobModel(BaseModel):
     application_info: Optional[ApplicationInfo] = Field(
         default_factory=ApplicationInfo, alias="applicationInfo"
     )
-    extracted_keywords: List[str] = Field(default_factory=list, alias="extractedKeywords")
+    extracted_keywords: _StrList = Field(default_factory=list, alias="extractedKeywords")
 
     @field_validator('job_title')
     @classmethod
     def validate_job_title(cls, v):
-        if not v or not v.strip():
-            return "Untitled Position"
-        return v.strip()
+        return v or "Untitled Position"
 
-    @field_validator('date_posted')
+    @field_validator('employment_type', mode='before')
     @classmethod
-    def validate_date_posted(cls, v):
-        if not v or not v.strip():
-            return datetime.now().strftime("%Y-%m-%d")
-        return v.strip()
+    def validate_employment_type(cls, v):
+        # JSON-mode enum validation never reaches _missing_, so resolve here
+        return EmploymentTypeEnum(v) if isinstance(v, str) else v
 
-    @field_validator('key_responsibilities', 'extracted_keywords')
+    @field_validator('date_posted')
     @classmethod
-    def validate_lists(cls, v):
-        if not v:
-            return []
-        return [item.strip() for item in v if item and item.strip()]
-
-    class ConfigDict:
-        validate_by_name = True
-        str_strip_whitespace = True
-        extra = 'ignore'  # Ignore extra fields instead of raising error
+    def validate_date_posted(cls, v):
+        return v or datetime.now().strftime("%Y-%m-%d")
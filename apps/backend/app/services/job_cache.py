@@ -0,0 +1,78 @@
+import re
+import orjson
+import logging
+
+from hashlib import blake2b
+from typing import Any, Dict, Optional
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import ExtractionCache
+
+logger = logging.getLogger(__name__)
+
+_URL_RE = re.compile(r"https?://\S+", re.IGNORECASE)
+
+
+class JobExtractionCache:
+    """
+    Exact-match cache of structured job extractions, keyed by a hash of the
+    normalized job description so re-uploaded postings skip the LLM call.
+    Entries hold the validated model's model_dump(mode="json") and are returned
+    as-is, so a hit yields exactly the data of the original extraction
+    (validators such as the date_posted default are not run again).
+    The namespace (model and prompt/schema version) is part of every key, so
+    changing either stops serving extractions made under the old one.
+    """
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        namespace: str = "",
+        ttl: timedelta = timedelta(days=30),
+    ):
+        self.db = db
+        self.namespace = namespace
+        self.ttl = ttl
+
+    def make_key(self, job_description_text: str) -> str:
+        """
+        Hashes the namespace and the job description after collapsing
+        whitespace and lowercasing URLs, so trivially different copies of a
+        posting share one entry.
+        """
+        normalized = " ".join(job_description_text.split())
+        normalized = _URL_RE.sub(lambda m: m.group(0).lower(), normalized)
+        return blake2b(
+            f"{self.namespace}\n{normalized}".encode(), digest_size=16
+        ).hexdigest()
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Returns the cached structured job data for the key, or None on a miss
+        or when the entry is older than the TTL.
+        """
+        cutoff = datetime.now(timezone.utc) - self.ttl
+        query = select(ExtractionCache.payload).where(
+            ExtractionCache.content_hash == key,
+            ExtractionCache.created_at >= cutoff,
+        )
+        payload = await self.db.scalar(query)
+        if payload is None:
+            return None
+        return orjson.loads(payload)
+
+    async def set(self, key: str, structured_job: Dict[str, Any]) -> None:
+        """
+        Stores the dumped structured job under the key. The entry is persisted
+        with the caller's next commit.
+        """
+        await self.db.merge(
+            ExtractionCache(
+                content_hash=key,
+                payload=orjson.dumps(structured_job).decode(),
+                created_at=datetime.now(timezone.utc),
+            )
+        )
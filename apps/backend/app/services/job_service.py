@@ -1,7 +1,10 @@
-import uuid
 import json
+import uuid
+import asyncio
 import logging
 from datetime import datetime
+from functools import lru_cache
+from hashlib import blake2b
 
 from typing import List, Dict, Any, Optional
 from pydantic import ValidationError
@@ -10,18 +13,54 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.agent import AgentManager
 from app.prompt import prompt_factory
-from app.schemas.json import json_schema_factory
 from app.models import Job, Resume, ProcessedJob
 from app.schemas.pydantic import StructuredJobModel
+from .job_cache import JobExtractionCache
 from .exceptions import JobNotFoundError
 
 logger = logging.getLogger(__name__)
 
+_PROMPT_PREFIX, _PROMPT_SUFFIX = prompt_factory.get_parts("structured_job")
+
+# Changes whenever the extraction prompt or the validating model changes, so
+# cached extractions made under an older version are no longer served
+_EXTRACTION_VERSION = blake2b(
+    (
+        _PROMPT_PREFIX
+        + _PROMPT_SUFFIX
+        + json.dumps(StructuredJobModel.model_json_schema(), sort_keys=True)
+    ).encode(),
+    digest_size=8,
+).hexdigest()
+
+# Upper bound on concurrent LLM extractions for one upload
+_MAX_CONCURRENT_EXTRACTIONS = 8
+
+# Postings outside these bounds skip the LLM (too short) or are cut (too long)
+_MIN_JOB_DESCRIPTION_CHARS = 40
+_MAX_JOB_DESCRIPTION_CHARS = 40_000
+
+_FALLBACK_KEYWORDS = (
+    'python', 'javascript', 'java', 'react', 'node', 'sql', 'aws', 'docker',
+    'kubernetes', 'git', 'linux', 'api', 'database', 'frontend', 'backend',
+    'full-stack', 'machine learning', 'ai', 'data', 'analytics', 'cloud'
+)
+
+
+@lru_cache(maxsize=1)
+def _get_agent() -> AgentManager:
+    """Process-wide JSON agent, so provider clients outlive a single request."""
+    return AgentManager(model="gemma3:4b")
+
 
 class JobService:
     def __init__(self, db: AsyncSession):
         self.db = db
-        self.json_agent_manager = AgentManager(model="gemma3:4b")
+        self.json_agent_manager = _get_agent()
+        self.extraction_cache = JobExtractionCache(
+            db,
+            namespace=f"{self.json_agent_manager.model_id()}:{_EXTRACTION_VERSION}",
+        )
 
     async def create_and_store_job(self, job_data: dict) -> List[str]:
         """
@@ -34,23 +73,23 @@ class JobService:
                 f"resume corresponding to resume_id: {resume_id} not found"
             )
 
-        job_ids = []
-        for job_description in job_data.get("job_descriptions", []):
-            job_id = str(uuid.uuid4())
-            job = Job(
-                job_id=job_id,
-                resume_id=str(resume_id),
-                content=job_description,
-            )
-            self.db.add(job)
+        job_descriptions = job_data.get("job_descriptions", [])
+        job_ids = [str(uuid.uuid4()) for _ in job_descriptions]
+        structured_jobs = await self._extract_structured_jobs(job_descriptions)
 
-            await self._extract_and_store_structured_job(
-                job_id=job_id, job_description_text=job_description
+        jobs = [
+            Job(job_id=job_id, resume_id=resume_id, content=job_description)
+            for job_id, job_description in zip(job_ids, job_descriptions)
+        ]
+        processed_jobs = [
+            self._build_processed_job(job_id, job_description, structured_job)
+            for job_id, job_description, structured_job in zip(
+                job_ids, job_descriptions, structured_jobs
             )
-            logger.info(f"Job ID: {job_id}")
-            job_ids.append(job_id)
-
+        ]
+        self.db.add_all(jobs + processed_jobs)
         await self.db.commit()
+        logger.info(f"Job IDs: {job_ids}")
         return job_ids
 
     async def _is_resume_available(self, resume_id: str) -> bool:
@@ -61,87 +100,103 @@ class JobService:
         result = await self.db.scalar(query)
         return result is not None
 
-    async def _extract_and_store_structured_job(
-        self, job_id, job_description_text: str
-    ):
+    async def _extract_structured_jobs(
+        self, job_descriptions: List[str]
+    ) -> List[Dict[str, Any] | None]:
         """
-        extract and store structured job data in the database
+        Extracts structured data, as StructuredJobModel.model_dump(mode="json")
+        dicts, for several job descriptions, serving repeats from the
+        extraction cache and running one LLM call per distinct uncached
+        posting, concurrently. The session is only touched sequentially.
         """
-        structured_job = await self._extract_structured_json(job_description_text)
-        
-        if not structured_job:
+        cache_keys = [self.extraction_cache.make_key(d) for d in job_descriptions]
+        cached = {
+            key: await self.extraction_cache.get(key)
+            for key in dict.fromkeys(cache_keys)
+        }
+        structured_jobs = [cached[key] for key in cache_keys]
+
+        # copies of the same posting within one upload share a single extraction
+        misses: Dict[str, List[int]] = {}
+        for i, key in enumerate(cache_keys):
+            if cached[key] is None:
+                misses.setdefault(key, []).append(i)
+        hits = len(structured_jobs) - sum(len(idxs) for idxs in misses.values())
+        if hits:
+            logger.info(f"Structured job cache hits: {hits}")
+
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_EXTRACTIONS)
+
+        async def _bounded_extract(job_description_text: str):
+            async with semaphore:
+                return await self._extract_structured_json(job_description_text)
+
+        extracted = await asyncio.gather(
+            *(_bounded_extract(job_descriptions[idxs[0]]) for idxs in misses.values())
+        )
+        for (key, idxs), structured_job in zip(misses.items(), extracted):
+            if structured_job is None:
+                continue
+            job = structured_job.model_dump(mode="json")
+            for i in idxs:
+                structured_jobs[i] = job
+            await self.extraction_cache.set(key, job)
+
+        return structured_jobs
+
+    def _build_processed_job(
+        self,
+        job_id: str,
+        job_description_text: str,
+        job: Dict[str, Any] | None,
+    ) -> ProcessedJob:
+        """
+        Builds (but does not add) the ProcessedJob row for the dumped structured
+        job data
+        """
+        if not job:
             logger.warning("Structured job extraction failed. Creating fallback record.")
             # Create a basic fallback record to prevent downstream failures
-            fallback_job = self._create_fallback_job_data(job_description_text)
-            structured_job = fallback_job
+            job = StructuredJobModel.model_validate(
+                self._create_fallback_job_data(job_description_text)
+            ).model_dump(mode="json")
 
-        try:
-            processed_job = ProcessedJob(
-                job_id=job_id,
-                job_title=structured_job.get("job_title"),
-                company_profile=json.dumps(structured_job.get("company_profile"))
-                if structured_job.get("company_profile")
-                else None,
-                location=json.dumps(structured_job.get("location"))
-                if structured_job.get("location")
-                else None,
-                date_posted=structured_job.get("date_posted"),
-                employment_type=structured_job.get("employment_type"),
-                job_summary=structured_job.get("job_summary"),
-                key_responsibilities=json.dumps(
-                    {"key_responsibilities": structured_job.get("key_responsibilities", [])}
-                )
-                if structured_job.get("key_responsibilities")
-                else None,
-                qualifications=json.dumps(structured_job.get("qualifications", []))
-                if structured_job.get("qualifications")
-                else None,
-                compensation_and_benfits=json.dumps(
-                    structured_job.get("compensation_and_benefits", [])
-                )
-                if structured_job.get("compensation_and_benefits")
-                else None,
-                application_info=json.dumps(structured_job.get("application_info", []))
-                if structured_job.get("application_info")
-                else None,
-                extracted_keywords=json.dumps(
-                    {"extracted_keywords": structured_job.get("extracted_keywords", [])}
-                )
-                if structured_job.get("extracted_keywords")
-                else None
-            )
-
-            self.db.add(processed_job)
-            await self.db.flush()
-            await self.db.commit()
-            logger.info(f"Successfully stored processed job {job_id}")
-            return job_id
-            
-        except Exception as e:
-            logger.error(f"Failed to store processed job {job_id}: {str(e)}")
-            # Even if storage fails, we should still commit the base job record
-            await self.db.commit()
-            raise
+        return ProcessedJob(
+            job_id=job_id,
+            job_title=job["job_title"],
+            company_profile=job["company_profile"],
+            location=job["location"],
+            date_posted=job["date_posted"],
+            employment_type=job["employment_type"],
+            job_summary=job["job_summary"],
+            key_responsibilities=job["key_responsibilities"] or None,
+            qualifications=job["qualifications"],
+            compensation_and_benfits=job["compensation_and_benefits"],
+            application_info=job["application_info"],
+            extracted_keywords=job["extracted_keywords"] or None,
+        )
 
     def _create_fallback_job_data(self, job_description_text: str) -> Dict[str, Any]:
         """
         Create a minimal job data structure when AI extraction fails
         """
         # Try to extract basic information using simple text processing
-        lines = job_description_text.split('\n')
-        first_line = next((line.strip() for line in lines if line.strip()), "Untitled Position")
+        # Scan line by line instead of splitting the whole posting into a list
+        first_line = "Untitled Position"
+        start, end = 0, len(job_description_text)
+        while start < end:
+            newline = job_description_text.find('\n', start)
+            if newline == -1:
+                newline = end
+            candidate = job_description_text[start:newline].strip()
+            if candidate:
+                first_line = candidate
+                break
+            start = newline + 1
         
         # Simple keyword extraction
-        keywords = []
-        common_keywords = [
-            'python', 'javascript', 'java', 'react', 'node', 'sql', 'aws', 'docker',
-            'kubernetes', 'git', 'linux', 'api', 'database', 'frontend', 'backend',
-            'full-stack', 'machine learning', 'ai', 'data', 'analytics', 'cloud'
-        ]
         text_lower = job_description_text.lower()
-        for keyword in common_keywords:
-            if keyword in text_lower:
-                keywords.append(keyword)
+        keywords = [keyword for keyword in _FALLBACK_KEYWORDS if keyword in text_lower]
         
         return {
             "job_title": first_line[:100],  # Truncate to reasonable length
@@ -179,28 +234,40 @@ class JobService:
 
     async def _extract_structured_json(
         self, job_description_text: str
-    ) -> Dict[str, Any] | None:
+    ) -> StructuredJobModel | None:
         """
         Uses the AgentManager+JSONWrapper to ask the LLM to
         return the data in exact JSON schema we need.
+        Does not touch the database, so calls can run concurrently.
+        Returns None without calling the LLM for near-empty postings, and
+        truncates oversized ones before building the prompt.
         """
-        prompt_template = prompt_factory.get("structured_job")
-        prompt = prompt_template.format(
-            json.dumps(json_schema_factory.get("structured_job"), indent=2),
-            job_description_text,
-        )
-        logger.info(f"Structured Job Prompt: {prompt}")
+        text = job_description_text.strip()
+        text_length = len(text)
+        if text_length < _MIN_JOB_DESCRIPTION_CHARS:
+            logger.warning(
+                f"Job description too short for extraction ({text_length} chars)"
+            )
+            return None
+        if text_length > _MAX_JOB_DESCRIPTION_CHARS:
+            logger.warning(
+                f"Job description truncated from {text_length} to {_MAX_JOB_DESCRIPTION_CHARS} chars"
+            )
+            text = text[:_MAX_JOB_DESCRIPTION_CHARS]
+
+        prompt = _PROMPT_PREFIX + text + _PROMPT_SUFFIX
+        logger.debug("Structured Job Prompt: %s", prompt)
         
         try:
-            raw_output = await self.json_agent_manager.run(prompt=prompt)
-            logger.info(f"LLM Raw Output: {raw_output}")
+            raw_output = await self.json_agent_manager.run_raw(prompt=prompt)
+            logger.debug("LLM Raw Output: %s", raw_output)
             
-            # Validate the raw output
-            structured_job: StructuredJobModel = StructuredJobModel.model_validate(
-                raw_output
+            # Validate straight from the JSON text
+            structured_job: StructuredJobModel = (
+                StructuredJobModel.model_validate_json(raw_output)
             )
             logger.info("Job validation successful")
-            return structured_job.model_dump(mode="json")
+            return structured_job
             
         except ValidationError as e:
             logger.error(f"Pydantic validation failed for job: {e}")
@@ -229,16 +296,18 @@ class JobService:
         Raises:
             JobNotFoundError: If the job is not found
         """
-        job_query = select(Job).where(Job.job_id == job_id)
-        job_result = await self.db.execute(job_query)
-        job = job_result.scalars().first()
+        query = (
+            select(Job, ProcessedJob)
+            .join(ProcessedJob, ProcessedJob.job_id == Job.job_id, isouter=True)
+            .where(Job.job_id == job_id)
+        )
+        result = await self.db.execute(query)
+        row = result.first()
 
-        if not job:
+        if not row:
             raise JobNotFoundError(job_id=job_id)
 
-        processed_query = select(ProcessedJob).where(ProcessedJob.job_id == job_id)
-        processed_result = await self.db.execute(processed_query)
-        processed_job = processed_result.scalars().first()
+        job, processed_job = row
 
         combined_data = {
             "job_id": job.job_id,
@@ -254,16 +323,16 @@ class JobService:
         if processed_job:
             combined_data["processed_job"] = {
                 "job_title": processed_job.job_title,
-                "company_profile": json.loads(processed_job.company_profile) if processed_job.company_profile else None,
-                "location": json.loads(processed_job.location) if processed_job.location else None,
+                "company_profile": processed_job.structured_field("company_profile"),
+                "location": processed_job.structured_field("location"),
                 "date_posted": processed_job.date_posted,
                 "employment_type": processed_job.employment_type,
                 "job_summary": processed_job.job_summary,
-                "key_responsibilities": json.loads(processed_job.key_responsibilities).get("key_responsibilities", []) if processed_job.key_responsibilities else None,
-                "qualifications": json.loads(processed_job.qualifications).get("qualifications", []) if processed_job.qualifications else None,
-                "compensation_and_benefits": json.loads(processed_job.compensation_and_benfits) if processed_job.compensation_and_benfits else None,
-                "application_info": json.loads(processed_job.application_info).get("application_info", []) if processed_job.application_info else None,
-                "extracted_keywords": json.loads(processed_job.extracted_keywords).get("extracted_keywords", []) if processed_job.extracted_keywords else None,
+                "key_responsibilities": processed_job.structured_field("key_responsibilities"),
+                "qualifications": processed_job.structured_field("qualifications"),
+                "compensation_and_benefits": processed_job.structured_field("compensation_and_benfits"),
+                "application_info": processed_job.structured_field("application_info"),
+                "extracted_keywords": processed_job.structured_field("extracted_keywords"),
                 "processed_at": processed_job.processed_at.isoformat() if processed_job.processed_at else None,
             }
 
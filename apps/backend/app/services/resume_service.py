@@ -19,6 +19,10 @@ from .exceptions import ResumeNotFoundError, ResumeValidationError
 
 logger = logging.getLogger(__name__)
 
+_STRUCTURED_RESUME_SCHEMA_JSON = json.dumps(
+    json_schema_factory.get("structured_resume"), indent=2
+)
+
 
 class ResumeService:
     def __init__(self, db: AsyncSession):
@@ -163,12 +167,10 @@ class ResumeService:
         Uses the AgentManager+JSONWrapper to ask the LLM to
         return the data in exact JSON schema we need.
         """
-        prompt_template = prompt_factory.get("structured_resume")
-        prompt = prompt_template.format(
-            json.dumps(json_schema_factory.get("structured_resume"), indent=2),
-            resume_text,
+        prompt = prompt_factory.build(
+            "structured_resume", _STRUCTURED_RESUME_SCHEMA_JSON, resume_text
         )
-        logger.info(f"Structured Resume Prompt: {prompt}")
+        logger.debug("Structured Resume Prompt: %s", prompt)
         raw_output = await self.json_agent_manager.run(prompt=prompt)
 
         try:
@@ -1,6 +1,7 @@
-import gc
+import re
 import json
 import asyncio
+import orjson
 import logging
 import markdown
 import numpy as np
@@ -8,12 +9,12 @@ import numpy as np
 from sqlalchemy.future import select
 from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import Dict, Optional, Tuple, AsyncGenerator
+from typing import Dict, List, Optional, Tuple, AsyncGenerator
 
 from app.prompt import prompt_factory
 from app.schemas.json import json_schema_factory
 from app.schemas.pydantic import ResumePreviewerModel
-from app.agent import EmbeddingManager, AgentManager
+from app.agent import EmbeddingManager, AgentManager, Embedding, cosine
 from app.models import Resume, Job, ProcessedResume, ProcessedJob
 from .exceptions import (
     ResumeNotFoundError,
@@ -26,6 +27,40 @@ from .exceptions import (
 
 logger = logging.getLogger(__name__)
 
+_RESUME_PREVIEW_SCHEMA_JSON = json.dumps(
+    json_schema_factory.get("resume_preview"), indent=2
+)
+
+# the service is built per request, so share one parser instead of letting
+# markdown.markdown() construct a new one on every call; convert() is
+# synchronous, so it is never reentered from the event loop
+_markdown = markdown.Markdown()
+
+
+def _keyword_pattern(keywords: frozenset) -> Optional[re.Pattern]:
+    """
+    Compiles the (lowercased) keywords into one whole-word pattern. Longer
+    keywords are tried first, so "machine learning" is counted rather than a
+    "machine" starting at the same place. Word edges are lookarounds rather
+    than \\b so skills such as "c++" still match.
+    """
+    if not keywords:
+        return None
+    alternatives = "|".join(
+        re.escape(kw) for kw in sorted(keywords, key=len, reverse=True)
+    )
+    return re.compile(rf"(?<!\w)(?=({alternatives})(?!\w))")
+
+
+def _keyword_overlap(text: str, pattern: Optional[re.Pattern]) -> int:
+    """
+    Counts how many distinct keywords of the pattern occur in the text as
+    whole words, so "ai" is not credited for "maintained".
+    """
+    if pattern is None:
+        return 0
+    return len(set(pattern.findall(text.lower())))
+
 
 class ScoreImprovementService:
     """
@@ -44,88 +79,110 @@ class ScoreImprovementService:
 
     def _validate_resume_keywords(
         self, processed_resume: ProcessedResume, resume_id: str
-    ) -> None:
+    ) -> List[str]:
         """
-        Validates that keyword extraction was successful for a resume.
+        Validates that keyword extraction was successful for a resume and
+        returns the parsed keywords.
         Raises ResumeKeywordExtractionError if keywords are missing or empty.
         """
         if not processed_resume.extracted_keywords:
             raise ResumeKeywordExtractionError(resume_id=resume_id)
 
         try:
-            keywords_data = json.loads(processed_resume.extracted_keywords)
-            keywords = keywords_data.get("extracted_keywords", [])
-            if not keywords or len(keywords) == 0:
-                raise ResumeKeywordExtractionError(resume_id=resume_id)
-        except json.JSONDecodeError:
+            keywords_data = orjson.loads(processed_resume.extracted_keywords)
+        except orjson.JSONDecodeError:
             raise ResumeKeywordExtractionError(resume_id=resume_id)
 
-    def _validate_job_keywords(self, processed_job: ProcessedJob, job_id: str) -> None:
+        keywords = keywords_data.get("extracted_keywords", [])
+        if not keywords:
+            raise ResumeKeywordExtractionError(resume_id=resume_id)
+        return keywords
+
+    def _validate_job_keywords(
+        self, processed_job: ProcessedJob, job_id: str
+    ) -> List[str]:
         """
-        Validates that keyword extraction was successful for a job.
-        Raises JobKeywordExtractionError if keywords are missing or empty.
+        Validates that keyword extraction was successful for a job and returns
+        the keywords, decoding rows stored in the legacy string format.
+        Raises JobKeywordExtractionError if keywords are missing, empty or not
+        a list of strings.
         """
-        if not processed_job.extracted_keywords:
-            raise JobKeywordExtractionError(job_id=job_id)
-
-        try:
-            keywords_data = json.loads(processed_job.extracted_keywords)
-            keywords = keywords_data.get("extracted_keywords", [])
-            if not keywords or len(keywords) == 0:
-                raise JobKeywordExtractionError(job_id=job_id)
-        except json.JSONDecodeError:
+        keywords = processed_job.structured_field("extracted_keywords")
+        if (
+            not keywords
+            or not isinstance(keywords, list)
+            or not all(isinstance(kw, str) for kw in keywords)
+        ):
             raise JobKeywordExtractionError(job_id=job_id)
+        return keywords
 
     async def _get_resume(
         self, resume_id: str
-    ) -> Tuple[Resume | None, ProcessedResume | None]:
+    ) -> Tuple[Resume, ProcessedResume, List[str]]:
         """
-        Fetches the resume from the database.
+        Fetches the resume from the database along with its parsed keywords.
         """
-        query = select(Resume).where(Resume.resume_id == resume_id)
+        query = (
+            select(Resume, ProcessedResume)
+            .join(
+                ProcessedResume,
+                ProcessedResume.resume_id == Resume.resume_id,
+                isouter=True,
+            )
+            .where(Resume.resume_id == resume_id)
+        )
         result = await self.db.execute(query)
-        resume = result.scalars().first()
+        row = result.first()
 
-        if not resume:
+        if not row:
             raise ResumeNotFoundError(resume_id=resume_id)
 
-        query = select(ProcessedResume).where(ProcessedResume.resume_id == resume_id)
-        result = await self.db.execute(query)
-        processed_resume = result.scalars().first()
+        resume, processed_resume = row
 
         if not processed_resume:
             raise ResumeParsingError(resume_id=resume_id)
 
-        self._validate_resume_keywords(processed_resume, resume_id)
+        keywords = self._validate_resume_keywords(processed_resume, resume_id)
 
-        return resume, processed_resume
+        return resume, processed_resume, self._clean_keywords(keywords)
 
-    async def _get_job(self, job_id: str) -> Tuple[Job | None, ProcessedJob | None]:
+    async def _get_job(
+        self, job_id: str
+    ) -> Tuple[Job, ProcessedJob, List[str]]:
         """
-        Fetches the job from the database.
+        Fetches the job from the database along with its extracted keywords.
         """
-        query = select(Job).where(Job.job_id == job_id)
+        query = (
+            select(Job, ProcessedJob)
+            .join(ProcessedJob, ProcessedJob.job_id == Job.job_id, isouter=True)
+            .where(Job.job_id == job_id)
+        )
         result = await self.db.execute(query)
-        job = result.scalars().first()
+        row = result.first()
 
-        if not job:
+        if not row:
             raise JobNotFoundError(job_id=job_id)
 
-        query = select(ProcessedJob).where(ProcessedJob.job_id == job_id)
-        result = await self.db.execute(query)
-        processed_job = result.scalars().first()
+        job, processed_job = row
 
         if not processed_job:
             raise JobParsingError(job_id=job_id)
 
-        self._validate_job_keywords(processed_job, job_id)
+        keywords = self._validate_job_keywords(processed_job, job_id)
 
-        return job, processed_job
+        return job, processed_job, self._clean_keywords(keywords)
+
+    @staticmethod
+    def _clean_keywords(keywords: List[str]) -> List[str]:
+        """
+        Strips surrounding whitespace from keywords and drops empty ones.
+        """
+        return [kw.strip() for kw in keywords if kw.strip()]
 
     def calculate_cosine_similarity(
         self,
-        extracted_job_keywords_embedding: np.ndarray,
-        resume_embedding: np.ndarray,
+        extracted_job_keywords_embedding: Embedding,
+        resume_embedding: Embedding,
     ) -> float:
         """
         Calculates the cosine similarity between two embeddings.
@@ -133,10 +190,7 @@ class ScoreImprovementService:
         if resume_embedding is None or extracted_job_keywords_embedding is None:
             return 0.0
 
-        ejk = np.asarray(extracted_job_keywords_embedding).squeeze()
-        re = np.asarray(resume_embedding).squeeze()
-
-        return float(np.dot(ejk, re) / (np.linalg.norm(ejk) * np.linalg.norm(re)))
+        return cosine(extracted_job_keywords_embedding, resume_embedding)
 
     async def improve_score_with_llm(
         self,
@@ -145,28 +199,45 @@ class ScoreImprovementService:
         job: str,
         extracted_job_keywords: str,
         previous_cosine_similarity_score: float,
-        extracted_job_keywords_embedding: np.ndarray,
+        extracted_job_keywords_embedding: Embedding,
+        job_keywords: Optional[List[str]] = None,
     ) -> Tuple[str, float]:
-        prompt_template = prompt_factory.get("resume_improvement")
         best_resume, best_score = resume, previous_cosine_similarity_score
 
+        # 关键词覆盖数未超过原简历的尝试不再计算向量 (原简历已全覆盖时不做预筛)
+        job_kw_set = frozenset(kw.lower() for kw in job_keywords or ())
+        job_kw_pattern = _keyword_pattern(job_kw_set)
+        baseline_overlap = _keyword_overlap(resume, job_kw_pattern)
+        if baseline_overlap == len(job_kw_set):
+            job_kw_pattern = None
+
+        # 每次尝试的输入都相同 (首次提升即返回), 因此提示词只需构建一次
+        prompt = prompt_factory.build(
+            "resume_improvement",
+            raw_job_description=job,
+            extracted_job_keywords=extracted_job_keywords,
+            raw_resume=best_resume,
+            extracted_resume_keywords=extracted_resume_keywords,
+            current_cosine_similarity=best_score,
+        )
+
         for attempt in range(1, self.max_retries + 1):
             logger.info(
                 f"Attempt {attempt}/{self.max_retries} to improve resume score."
             )
-            prompt = prompt_template.format(
-                raw_job_description=job,
-                extracted_job_keywords=extracted_job_keywords,
-                raw_resume=best_resume,
-                extracted_resume_keywords=extracted_resume_keywords,
-                current_cosine_similarity=best_score,
-            )
-            improved = await self.md_agent_manager.run(prompt)
-            emb = await self.embedding_manager.embed(text=improved)
-            score = self.calculate_cosine_similarity(
-                emb, extracted_job_keywords_embedding
+            improved, score = await self._score_attempt(
+                prompt,
+                extracted_job_keywords_embedding,
+                job_kw_pattern,
+                baseline_overlap,
             )
 
+            if score is None:
+                logger.info(
+                    f"Attempt {attempt} added no job keywords, skipped scoring."
+                )
+                continue
+
             if score > best_score:
                 return improved, score
 
@@ -176,41 +247,84 @@ class ScoreImprovementService:
 
         return best_resume, best_score
 
+    async def _score_attempt(
+        self,
+        prompt: str,
+        job_embedding: Embedding,
+        job_kw_pattern: Optional[re.Pattern] = None,
+        baseline_overlap: int = 0,
+    ) -> Tuple[str, Optional[float]]:
+        """
+        Runs one improvement attempt and scores it against the job keywords.
+        The score is None when the attempt mentions no more of the keywords in
+        `job_kw_pattern` than `baseline_overlap`, in which case the embedding
+        call is skipped.
+        """
+        improved = await self.md_agent_manager.run(prompt)
+        if (
+            job_kw_pattern is not None
+            and _keyword_overlap(improved, job_kw_pattern) <= baseline_overlap
+        ):
+            return improved, None
+        emb = Embedding.from_vector(await self.embedding_manager.embed(text=improved))
+        score = self.calculate_cosine_similarity(job_embedding, emb)
+        return improved, score
+
     async def _generate_analysis_details(
         self,
         original_score: float,
         new_score: float,
-        resume_keywords: str,
-        job_keywords: str,
+        resume_keywords: List[str],
+        job_keywords: List[str],
         vector_analysis: Dict = None
     ) -> str:
         """生成详细的技能匹配分析"""
         # 分析关键词匹配情况
-        resume_kw_list = [kw.strip().lower() for kw in resume_keywords.split(",") if kw.strip()]
-        job_kw_list = [kw.strip().lower() for kw in job_keywords.split(",") if kw.strip()]
+        resume_kw_set = frozenset(kw.lower() for kw in resume_keywords)
+        job_kw_set = frozenset(kw.lower() for kw in job_keywords)
         
-        matched_keywords = list(set(resume_kw_list) & set(job_kw_list))
-        missing_keywords = list(set(job_kw_list) - set(resume_kw_list))
+        matched_keywords = list(resume_kw_set & job_kw_set)
+        missing_keywords = list(job_kw_set - resume_kw_set)
         
         score_improvement = (new_score - original_score) * 100
         
-        details = f"""技能匹配分析：
-• 匹配的关键技能 ({len(matched_keywords)}个): {', '.join(matched_keywords[:10]) if matched_keywords else '无直接匹配'}
-• 待加强的技能 ({len(missing_keywords)}个): {', '.join(missing_keywords[:10]) if missing_keywords else '无'}
-• 原始匹配度: {original_score:.1%}
-• 优化后匹配度: {new_score:.1%}
-• 分数提升: {score_improvement:+.1f}%
-• 关键词覆盖率: {len(matched_keywords)/(len(job_kw_list) or 1):.1%}"""
+        parts = [
+            "技能匹配分析：",
+            f"• 匹配的关键技能 ({len(matched_keywords)}个): {', '.join(matched_keywords[:10]) or '无直接匹配'}",
+            f"• 待加强的技能 ({len(missing_keywords)}个): {', '.join(missing_keywords[:10]) or '无'}",
+            f"• 原始匹配度: {original_score:.1%}",
+            f"• 优化后匹配度: {new_score:.1%}",
+            f"• 分数提升: {score_improvement:+.1f}%",
+            f"• 关键词覆盖率: {len(matched_keywords)/(len(job_keywords) or 1):.1%}",
+        ]
         
         if vector_analysis:
-            details += f"""
-• 高匹配度技能 ({vector_analysis["coverage_statistics"]["well_matched_skills"]}个): {', '.join([s["job_skill"] for s in vector_analysis["skill_by_skill_analysis"] if s["similarity_score"] > 0.7][:10]) if [s["job_skill"] for s in vector_analysis["skill_by_skill_analysis"] if s["similarity_score"] > 0.7] else '无'}
-• 中等匹配度技能 ({vector_analysis["coverage_statistics"]["medium_coverage"]}%): {', '.join([s["job_skill"] for s in vector_analysis["skill_by_skill_analysis"] if 0.4 <= s["similarity_score"] <= 0.7][:10]) if [s["job_skill"] for s in vector_analysis["skill_by_skill_analysis"] if 0.4 <= s["similarity_score"] <= 0.7] else '无'}
-• 低匹配度技能 ({vector_analysis["coverage_statistics"]["low_coverage"]}%): {', '.join([s["job_skill"] for s in vector_analysis["skill_by_skill_analysis"] if s["similarity_score"] < 0.4][:10]) if [s["job_skill"] for s in vector_analysis["skill_by_skill_analysis"] if s["similarity_score"] < 0.4] else '无'}
-"""
+            parts.extend(self._skill_bucket_lines(vector_analysis))
+            parts.append("")
         
+        details = "\n".join(parts)
         return details
 
+    @staticmethod
+    def _skill_bucket_lines(vector_analysis: Dict) -> List[str]:
+        """按相似度将技能分为高 (>0.7)、中 (0.4-0.7)、低 (<0.4) 三档, 只遍历一次, 返回三行摘要"""
+        high, medium, low = [], [], []
+        for s in vector_analysis["skill_by_skill_analysis"]:
+            score = s["similarity_score"]
+            if score > 0.7:
+                high.append(s["job_skill"])
+            elif score >= 0.4:
+                medium.append(s["job_skill"])
+            else:
+                low.append(s["job_skill"])
+
+        stats = vector_analysis["coverage_statistics"]
+        return [
+            f"• 高匹配度技能 ({stats['well_matched_skills']}个): {', '.join(high[:10]) or '无'}",
+            f"• 中等匹配度技能 ({stats['medium_coverage']}%): {', '.join(medium[:10]) or '无'}",
+            f"• 低匹配度技能 ({stats['low_coverage']}%): {', '.join(low[:10]) or '无'}",
+        ]
+
     async def _generate_analysis_commentary(
         self,
         original_score: float,
@@ -233,20 +347,19 @@ class ScoreImprovementService:
             grade = "需要改进"
             advice = "建议重点关注缺失的技能要求，优化简历内容后再投递。"
             
-        commentary = f"""整体评价: {grade} ({score_pct:.0f}分)
-{advice}
-
-通过AI优化，您的简历匹配度提升了 {improvement:+.1f} 个百分点。建议关注职位描述中的核心技能要求，确保简历充分体现相关经验和能力。"""
+        parts = [
+            f"整体评价: {grade} ({score_pct:.0f}分)",
+            advice,
+            "",
+            f"通过AI优化，您的简历匹配度提升了 {improvement:+.1f} 个百分点。建议关注职位描述中的核心技能要求，确保简历充分体现相关经验和能力。",
+        ]
         
         if vector_analysis:
-            commentary += f"""
-
-向量分析结果：
-• 高匹配度技能 ({vector_analysis["coverage_statistics"]["well_matched_skills"]}个): {', '.join([s["job_skill"] for s in vector_analysis["skill_by_skill_analysis"] if s["similarity_score"] > 0.7][:10]) if [s["job_skill"] for s in vector_analysis["skill_by_skill_analysis"] if s["similarity_score"] > 0.7] else '无'}
-• 中等匹配度技能 ({vector_analysis["coverage_statistics"]["medium_coverage"]}%): {', '.join([s["job_skill"] for s in vector_analysis["skill_by_skill_analysis"] if 0.4 <= s["similarity_score"] <= 0.7][:10]) if [s["job_skill"] for s in vector_analysis["skill_by_skill_analysis"] if 0.4 <= s["similarity_score"] <= 0.7] else '无'}
-• 低匹配度技能 ({vector_analysis["coverage_statistics"]["low_coverage"]}%): {', '.join([s["job_skill"] for s in vector_analysis["skill_by_skill_analysis"] if s["similarity_score"] < 0.4][:10]) if [s["job_skill"] for s in vector_analysis["skill_by_skill_analysis"] if s["similarity_score"] < 0.4] else '无'}
-"""
+            parts.extend(["", "向量分析结果："])
+            parts.extend(self._skill_bucket_lines(vector_analysis))
+            parts.append("")
         
+        commentary = "\n".join(parts)
         return commentary
 
     async def _generate_improvement_suggestions(
@@ -289,70 +402,68 @@ class ScoreImprovementService:
         self,
         resume_content: str,
         job_content: str,
-        resume_keywords: str,
-        job_keywords: str
+        resume_kw_list: List[str],
+        job_kw_list: List[str]
     ) -> Dict:
         """深度向量分析：计算每个技能点的匹配度和偏离度"""
         
-        # 分解关键词
-        resume_kw_list = [kw.strip() for kw in resume_keywords.split(",") if kw.strip()]
-        job_kw_list = [kw.strip() for kw in job_keywords.split(",") if kw.strip()]
-        
-        # 为每个技能点计算单独的向量相似度
-        skill_analysis = []
-        coverage_gaps = []
-        strength_areas = []
-        
-        for job_skill in job_kw_list:
-            # 计算每个职位要求技能的匹配度
-            job_skill_embedding = await self.embedding_manager.embed(job_skill)
-            
-            # 查找简历中最相关的技能
-            best_match_score = 0.0
-            best_match_skill = None
-            
-            for resume_skill in resume_kw_list:
-                resume_skill_embedding = await self.embedding_manager.embed(resume_skill)
-                similarity = self.calculate_cosine_similarity(
-                    np.array(job_skill_embedding), 
-                    np.array(resume_skill_embedding)
-                )
-                
-                if similarity > best_match_score:
-                    best_match_score = similarity
-                    best_match_skill = resume_skill
-            
-            # 分析匹配程度
-            match_level = "强匹配" if best_match_score > 0.8 else \
-                         "中等匹配" if best_match_score > 0.6 else \
-                         "弱匹配" if best_match_score > 0.3 else "未覆盖"
-            
-            skill_analysis.append({
+        # 批量计算所有技能的向量, 一次矩阵乘法得到全部两两相似度
+        best_scores, best_indices = await self._best_skill_matches(
+            job_kw_list, resume_kw_list
+        )
+        # 查找简历中最相关的技能 (相似度需为正)
+        best_scores = np.maximum(best_scores, 0.0)
+
+        # 分析匹配程度
+        match_levels = np.select(
+            [best_scores > 0.8, best_scores > 0.6, best_scores > 0.3],
+            ["强匹配", "中等匹配", "弱匹配"],
+            default="未覆盖",
+        )
+        gap_mask = best_scores < 0.4
+        strength_mask = best_scores > 0.7
+
+        scores = best_scores.tolist()
+        best_matches = [
+            resume_kw_list[j] if score > 0.0 else None
+            for j, score in zip(best_indices.tolist(), scores)
+        ]
+
+        skill_analysis = [
+            {
                 "job_skill": job_skill,
-                "best_resume_match": best_match_skill or "无匹配",
-                "similarity_score": best_match_score,
-                "match_level": match_level,
-                "coverage_percentage": best_match_score * 100
-            })
-            
-            # 分类技能差距和优势
-            if best_match_score < 0.4:
-                coverage_gaps.append({
-                    "missing_skill": job_skill,
-                    "gap_severity": "高" if best_match_score < 0.2 else "中",
-                    "suggested_action": "重点补强" if best_match_score < 0.2 else "适度加强"
-                })
-            elif best_match_score > 0.7:
-                strength_areas.append({
-                    "strong_skill": job_skill,
-                    "resume_match": best_match_skill,
-                    "strength_level": "核心优势" if best_match_score > 0.85 else "明显优势"
-                })
-        
+                "best_resume_match": best_match or "无匹配",
+                "similarity_score": score,
+                "match_level": str(level),
+                "coverage_percentage": score * 100
+            }
+            for job_skill, best_match, score, level in zip(
+                job_kw_list, best_matches, scores, match_levels.tolist()
+            )
+        ]
+
+        # 分类技能差距和优势
+        coverage_gaps = [
+            {
+                "missing_skill": job_kw_list[i],
+                "gap_severity": "高" if scores[i] < 0.2 else "中",
+                "suggested_action": "重点补强" if scores[i] < 0.2 else "适度加强"
+            }
+            for i in np.flatnonzero(gap_mask).tolist()
+        ]
+        strength_areas = [
+            {
+                "strong_skill": job_kw_list[i],
+                "resume_match": best_matches[i],
+                "strength_level": "核心优势" if scores[i] > 0.85 else "明显优势"
+            }
+            for i in np.flatnonzero(strength_mask).tolist()
+        ]
+
         # 计算各维度覆盖率
-        high_match_count = sum(1 for s in skill_analysis if s["similarity_score"] > 0.7)
-        medium_match_count = sum(1 for s in skill_analysis if 0.4 <= s["similarity_score"] <= 0.7)
-        low_match_count = sum(1 for s in skill_analysis if s["similarity_score"] < 0.4)
+        high_match_count = int(strength_mask.sum())
+        low_match_count = int(gap_mask.sum())
+        medium_match_count = len(job_kw_list) - high_match_count - low_match_count
         
         total_skills = len(job_kw_list)
         coverage_stats = {
@@ -374,6 +485,32 @@ class ScoreImprovementService:
             )
         }
 
+    async def _best_skill_matches(
+        self, job_kw_list: list, resume_kw_list: list
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        For each job skill, returns the best cosine similarity against the
+        resume skills and the index of that resume skill. Uses two batched
+        embedding calls and a single similarity matrix product.
+        """
+        if not job_kw_list or not resume_kw_list:
+            return (
+                np.zeros(len(job_kw_list), dtype=np.float32),
+                np.zeros(len(job_kw_list), dtype=int),
+            )
+
+        job_matrix, resume_matrix = await asyncio.gather(
+            self.embedding_manager.embed_many(job_kw_list),
+            self.embedding_manager.embed_many(resume_kw_list),
+        )
+        job_norms = np.linalg.norm(job_matrix, axis=1, keepdims=True)
+        resume_norms = np.linalg.norm(resume_matrix, axis=1, keepdims=True)
+        job_matrix = job_matrix / np.where(job_norms == 0, 1, job_norms)
+        resume_matrix = resume_matrix / np.where(resume_norms == 0, 1, resume_norms)
+
+        similarity = job_matrix @ resume_matrix.T
+        return similarity.max(axis=1), similarity.argmax(axis=1)
+
     async def _generate_vector_based_recommendations(
         self,
         skill_analysis: list,
@@ -434,83 +571,95 @@ class ScoreImprovementService:
         """
         Returns the updated resume in a format suitable for the dashboard.
         """
-        prompt_template = prompt_factory.get("structured_resume")
-        prompt = prompt_template.format(
-            json.dumps(json_schema_factory.get("resume_preview"), indent=2),
-            updated_resume,
+        prompt = prompt_factory.build(
+            "structured_resume", _RESUME_PREVIEW_SCHEMA_JSON, updated_resume
         )
-        logger.info(f"Structured Resume Prompt: {prompt}")
-        raw_output = await self.json_agent_manager.run(prompt=prompt)
+        logger.debug("Structured Resume Prompt: %s", prompt)
+        raw_output = await self.json_agent_manager.run_raw(prompt=prompt)
 
         try:
-            resume_preview: ResumePreviewerModel = ResumePreviewerModel.model_validate(
-                raw_output
+            resume_preview: ResumePreviewerModel = (
+                ResumePreviewerModel.model_validate_json(raw_output)
             )
         except ValidationError as e:
             logger.info(f"Validation error: {e}")
             return None
         return resume_preview.model_dump()
 
+    async def _embed_resume_and_job_keywords(
+        self, resume_content: str, extracted_job_keywords: str
+    ) -> Tuple[Embedding, Embedding]:
+        """
+        Embeds the resume and the joined job keywords concurrently; if one call
+        fails the other is cancelled.
+        """
+        async with asyncio.TaskGroup() as tg:
+            resume_task = tg.create_task(self.embedding_manager.embed(resume_content))
+            job_kw_task = tg.create_task(
+                self.embedding_manager.embed(extracted_job_keywords)
+            )
+        return (
+            Embedding.from_vector(resume_task.result()),
+            Embedding.from_vector(job_kw_task.result()),
+        )
+
     async def run(self, resume_id: str, job_id: str) -> Dict:
         """
         Main method to run the scoring and improving process and return dict.
         """
 
-        resume, processed_resume = await self._get_resume(resume_id)
-        job, processed_job = await self._get_job(job_id)
+        resume, processed_resume, resume_keywords = await self._get_resume(resume_id)
+        job, processed_job, job_keywords = await self._get_job(job_id)
 
-        extracted_job_keywords = ", ".join(
-            json.loads(processed_job.extracted_keywords).get("extracted_keywords", [])
-        )
+        extracted_job_keywords = ", ".join(job_keywords)
 
-        extracted_resume_keywords = ", ".join(
-            json.loads(processed_resume.extracted_keywords).get(
-                "extracted_keywords", []
-            )
-        )
+        extracted_resume_keywords = ", ".join(resume_keywords)
 
-        resume_embedding_task = asyncio.create_task(
-            self.embedding_manager.embed(resume.content)
-        )
-        job_kw_embedding_task = asyncio.create_task(
-            self.embedding_manager.embed(extracted_job_keywords)
-        )
-        resume_embedding, extracted_job_keywords_embedding = await asyncio.gather(
-            resume_embedding_task, job_kw_embedding_task
+        resume_embedding, extracted_job_keywords_embedding = (
+            await self._embed_resume_and_job_keywords(
+                resume.content, extracted_job_keywords
+            )
         )
 
         cosine_similarity_score = self.calculate_cosine_similarity(
             extracted_job_keywords_embedding, resume_embedding
         )
-        updated_resume, updated_score = await self.improve_score_with_llm(
-            resume=resume.content,
-            extracted_resume_keywords=extracted_resume_keywords,
-            job=job.content,
-            extracted_job_keywords=extracted_job_keywords,
-            previous_cosine_similarity_score=cosine_similarity_score,
-            extracted_job_keywords_embedding=extracted_job_keywords_embedding,
-        )
 
-        resume_preview = await self.get_resume_for_previewer(
-            updated_resume=updated_resume
-        )
+        # 深度向量分析只依赖原始关键词, 与LLM优化并行执行; 任一失败时取消另一方
+        async with asyncio.TaskGroup() as tg:
+            vector_analysis_task = tg.create_task(
+                self._analyze_vector_components(
+                    resume_content=resume.content,
+                    job_content=job.content,
+                    resume_kw_list=resume_keywords,
+                    job_kw_list=job_keywords
+                )
+            )
+
+            updated_resume, updated_score = await self.improve_score_with_llm(
+                resume=resume.content,
+                extracted_resume_keywords=extracted_resume_keywords,
+                job=job.content,
+                extracted_job_keywords=extracted_job_keywords,
+                previous_cosine_similarity_score=cosine_similarity_score,
+                extracted_job_keywords_embedding=extracted_job_keywords_embedding,
+                job_keywords=job_keywords,
+            )
+
+            resume_preview = await self.get_resume_for_previewer(
+                updated_resume=updated_resume
+            )
 
-        logger.info(f"Resume Preview: {resume_preview}")
+        logger.debug("Resume Preview: %s", resume_preview)
 
-        # 执行深度向量分析
-        vector_analysis = await self._analyze_vector_components(
-            resume_content=resume.content,
-            job_content=job.content,
-            resume_keywords=extracted_resume_keywords,
-            job_keywords=extracted_job_keywords
-        )
+        vector_analysis = vector_analysis_task.result()
 
         # 生成详细分析报告
         details = await self._generate_analysis_details(
             original_score=cosine_similarity_score,
             new_score=updated_score,
-            resume_keywords=extracted_resume_keywords,
-            job_keywords=extracted_job_keywords,
+            resume_keywords=resume_keywords,
+            job_keywords=job_keywords,
             vector_analysis=vector_analysis
         )
         
@@ -529,7 +678,7 @@ class ScoreImprovementService:
             "job_id": job_id,
             "original_score": cosine_similarity_score,
             "new_score": updated_score,
-            "updated_resume": markdown.markdown(text=updated_resume),
+            "updated_resume": _markdown.reset().convert(updated_resume),
             "resume_preview": resume_preview,
             "details": details,
             "commentary": commentary,
@@ -537,8 +686,6 @@ class ScoreImprovementService:
             "vector_analysis": vector_analysis,  # 添加完整的向量分析数据
         }
 
-        gc.collect()
-
         return execution
 
     async def run_and_stream(self, resume_id: str, job_id: str) -> AsyncGenerator:
@@ -549,25 +696,20 @@ class ScoreImprovementService:
         yield f"data: {json.dumps({'status': 'starting', 'message': 'Analyzing resume and job description...'})}\n\n"
         await asyncio.sleep(2)
 
-        resume, processed_resume = await self._get_resume(resume_id)
-        job, processed_job = await self._get_job(job_id)
+        resume, processed_resume, resume_keywords = await self._get_resume(resume_id)
+        job, processed_job, job_keywords = await self._get_job(job_id)
 
         yield f"data: {json.dumps({'status': 'parsing', 'message': 'Parsing resume content...'})}\n\n"
         await asyncio.sleep(2)
 
-        extracted_job_keywords = ", ".join(
-            json.loads(processed_job.extracted_keywords).get("extracted_keywords", [])
-        )
+        extracted_job_keywords = ", ".join(job_keywords)
 
-        extracted_resume_keywords = ", ".join(
-            json.loads(processed_resume.extracted_keywords).get(
-                "extracted_keywords", []
-            )
-        )
+        extracted_resume_keywords = ", ".join(resume_keywords)
 
-        resume_embedding = await self.embedding_manager.embed(text=resume.content)
-        extracted_job_keywords_embedding = await self.embedding_manager.embed(
-            text=extracted_job_keywords
+        resume_embedding, extracted_job_keywords_embedding = (
+            await self._embed_resume_and_job_keywords(
+                resume.content, extracted_job_keywords
+            )
         )
 
         yield f"data: {json.dumps({'status': 'scoring', 'message': 'Calculating compatibility score...'})}\n\n"
@@ -582,17 +724,36 @@ class ScoreImprovementService:
         yield f"data: {json.dumps({'status': 'improving', 'message': 'Generating improvement suggestions...'})}\n\n"
         await asyncio.sleep(3)
 
-        updated_resume, updated_score = await self.improve_score_with_llm(
-            resume=resume.content,
-            extracted_resume_keywords=extracted_resume_keywords,
-            job=job.content,
-            extracted_job_keywords=extracted_job_keywords,
-            previous_cosine_similarity_score=cosine_similarity_score,
-            extracted_job_keywords_embedding=extracted_job_keywords_embedding,
+        # LLM优化在后台执行, 期间先推送逐项技能分析结果
+        improve_task = asyncio.create_task(
+            self.improve_score_with_llm(
+                resume=resume.content,
+                extracted_resume_keywords=extracted_resume_keywords,
+                job=job.content,
+                extracted_job_keywords=extracted_job_keywords,
+                previous_cosine_similarity_score=cosine_similarity_score,
+                extracted_job_keywords_embedding=extracted_job_keywords_embedding,
+                job_keywords=job_keywords,
+            )
         )
+        try:
+            vector_analysis = await self._analyze_vector_components(
+                resume_content=resume.content,
+                job_content=job.content,
+                resume_kw_list=resume_keywords,
+                job_kw_list=job_keywords
+            )
+
+            for skill in vector_analysis["skill_by_skill_analysis"]:
+                yield f"data: {json.dumps({'status': 'skill', 'name': skill['job_skill'], 'score': skill['similarity_score'], 'match_level': skill['match_level']})}\n\n"
+
+            updated_resume, updated_score = await improve_task
+        finally:
+            # 客户端断开或出错时不再发起后续尝试 (已在线程中执行的LLM调用仍会完成)
+            improve_task.cancel()
 
-        for i, suggestion in enumerate(updated_resume):
-            yield f"data: {json.dumps({'status': 'suggestion', 'index': i, 'text': suggestion})}\n\n"
+        for i, recommendation in enumerate(vector_analysis["detailed_recommendations"]):
+            yield f"data: {json.dumps({'status': 'suggestion', 'index': i, 'text': recommendation['suggestion']})}\n\n"
             await asyncio.sleep(0.2)
 
         final_result = {
@@ -600,7 +761,7 @@ class ScoreImprovementService:
             "job_id": job_id,
             "original_score": cosine_similarity_score,
             "new_score": updated_score,
-            "updated_resume": markdown.markdown(text=updated_resume),
+            "updated_resume": _markdown.reset().convert(updated_resume),
         }
 
         yield f"data: {json.dumps({'status': 'completed', 'result': final_result})}\n\n"